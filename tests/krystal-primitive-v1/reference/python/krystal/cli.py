@@ -43,13 +43,67 @@ def _cmd_decode_url(args: argparse.Namespace) -> int:
     return 0
 
 
+def _sample_spec(value: str) -> int | float:
+    """Parse --sample: an integer count (e.g. 500) or a decimal fraction below 1 (e.g. 0.05)."""
+    if value.isdigit():
+        count = int(value)
+        if count < 1:
+            raise argparse.ArgumentTypeError("sample count must be >= 1")
+        return count
+    try:
+        frac = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample spec: {value!r}")
+    if not (0.0 < frac < 1.0):
+        raise argparse.ArgumentTypeError(
+            f"sample fraction must be in (0, 1), got {value!r}; "
+            "give an integer count (e.g. 1000) or omit --sample for a full pass"
+        )
+    return frac
+
+
+def _max_errors_spec(value: str) -> int:
+    try:
+        k = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid max-errors value: {value!r}")
+    if k < 1:
+        raise argparse.ArgumentTypeError("max-errors must be >= 1")
+    return k
+
+
+def _confidence_spec(value: str) -> float:
+    try:
+        c = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid confidence value: {value!r}")
+    if not (0.0 < c < 1.0):
+        raise argparse.ArgumentTypeError("confidence must be in (0, 1), e.g. 0.95")
+    return c
+
+
 def _cmd_verify_registry(args: argparse.Namespace) -> int:
     reg = load_registry(args.path)
-    result = verify_registry(reg, strict=not args.non_strict)
+    max_errors = 1 if args.fail_fast else args.max_errors
+    result = verify_registry(
+        reg,
+        strict=not args.non_strict,
+        sample=args.sample,
+        seed=args.seed,
+        max_errors=max_errors,
+        confidence=args.confidence,
+    )
     out = {
         "ok": result.ok,
         "total": result.total,
         "decoded": result.decoded,
+        "checked": result.checked,
+        "partial": result.partial,
+        "sampled": result.sampled,
+        "stoppedEarly": result.stopped_early,
+        "errorRate": result.error_rate,
+        "errorRateCI": list(result.error_rate_ci) if result.error_rate_ci is not None else None,
+        "confidence": result.confidence,
         "issues": [
             {
                 "index": i.index,
@@ -95,6 +149,25 @@ def main(argv: list[str] | None = None) -> None:
     p_ver = sub.add_parser("verify-registry", help="Verify a KRC-0 registry JSON file")
     p_ver.add_argument("path", help="Path to registry JSON")
     p_ver.add_argument("--non-strict", action="store_true", help="Warn instead of error for unknown locators")
+    p_ver.add_argument(
+        "--sample",
+        type=_sample_spec,
+        metavar="N|FRACTION",
+        help=(
+            "Verify a seeded uniform random sample and estimate the error rate. "
+            "An integer is a count of entries (1 = one entry); a decimal is a fraction in (0, 1)"
+        ),
+    )
+    p_ver.add_argument("--seed", type=int, default=0, help="Seed for --sample (default: 0)")
+    p_ver.add_argument(
+        "--confidence",
+        type=_confidence_spec,
+        default=0.95,
+        help="Confidence level for the error-rate interval (default: 0.95)",
+    )
+    p_stop = p_ver.add_mutually_exclusive_group()
+    p_stop.add_argument("--fail-fast", action="store_true", help="Stop at the first error (same as --max-errors 1)")
+    p_stop.add_argument("--max-errors", type=_max_errors_spec, metavar="K", help="Stop after K errors")
     p_ver.set_defaults(func=_cmd_verify_registry)
 
     p_norm = sub.add_parser("normalize-registry", help="Rewrite a registry with corrected capsule metadata")
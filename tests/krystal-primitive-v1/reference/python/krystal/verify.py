@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import math
+import random
 from dataclasses import dataclass
-from typing import List, Optional
+from fractions import Fraction
+from statistics import NormalDist
+from typing import Iterable, List, Optional, Tuple, Union
 
 from .kks import kks_1_0
 from .krl import decode_krl
@@ -23,60 +27,175 @@ class VerificationResult:
     total: int
     decoded: int
     issues: List[VerificationIssue]
+    # Partial runs (sampling / early stop) only looked at `checked` of `total` entries.
+    checked: Optional[int] = None
+    sampled: bool = False
+    stopped_early: bool = False
+    # Fraction of checked entries with at least one error, and its confidence interval.
+    # None when the run stopped early (the checked prefix is not a uniform sample).
+    error_rate: Optional[float] = None
+    error_rate_ci: Optional[Tuple[float, float]] = None
+    confidence: Optional[float] = None
 
+    @property
+    def partial(self) -> bool:
+        return self.sampled or self.stopped_early
 
-def verify_registry(registry: Registry, *, strict: bool = True) -> VerificationResult:
-    issues: List[VerificationIssue] = []
-    decoded = 0
 
-    for i, url in enumerate(registry.urls):
-        try:
-            d = decode_krl(url)
-            decoded += 1
-        except Exception as e:
-            issues.append(
-                VerificationIssue(
-                    index=i,
-                    url=url,
-                    level="error" if strict else "warn",
-                    code="krl_decode_failed",
-                    message=str(e),
-                )
+def _verify_entry(i: int, url: str, strict: bool) -> Tuple[bool, List[VerificationIssue]]:
+    """Check one registry entry. Returns (decoded, issues)."""
+    try:
+        d = decode_krl(url)
+    except Exception as e:
+        return False, [
+            VerificationIssue(
+                index=i,
+                url=url,
+                level="error" if strict else "warn",
+                code="krl_decode_failed",
+                message=str(e),
             )
-            continue
+        ]
 
-        # Unknown locators are errors in strict mode (can't be verified)
-        if d.kind == "unknown":
-            issues.append(
+    # Unknown locators are errors in strict mode (can't be verified)
+    if d.kind == "unknown":
+        return True, [
+            VerificationIssue(
+                index=i,
+                url=url,
+                level="error" if strict else "warn",
+                code="unknown_locator",
+                message="unrecognized locator shape",
+            )
+        ]
+
+    # Coordinate validation if claim is present
+    if d.pulse is not None and d.beat is not None and d.step_index is not None:
+        coord = kks_1_0(d.pulse)
+        if coord.beat != d.beat or coord.step_index != d.step_index:
+            return True, [
                 VerificationIssue(
                     index=i,
                     url=url,
-                    level="error" if strict else "warn",
-                    code="unknown_locator",
-                    message="unrecognized locator shape",
-                )
-            )
-            continue
-
-        # Coordinate validation if claim is present
-        if d.pulse is not None and d.beat is not None and d.step_index is not None:
-            coord = kks_1_0(d.pulse)
-            if coord.beat != d.beat or coord.step_index != d.step_index:
-                issues.append(
-                    VerificationIssue(
-                        index=i,
-                        url=url,
-                        level="error",
-                        code="kks_mismatch",
-                        message=(
-                            f"claimed beat/step=({d.beat},{d.step_index}) "
-                            f"but derived=({coord.beat},{coord.step_index}) for pulse={d.pulse}"
-                        ),
-                    )
+                    level="error",
+                    code="kks_mismatch",
+                    message=(
+                        f"claimed beat/step=({d.beat},{d.step_index}) "
+                        f"but derived=({coord.beat},{coord.step_index}) for pulse={d.pulse}"
+                    ),
                 )
+            ]
+
+    # If pulse is present but beat/step is missing, that's allowed; verifier can't check.
+    # Producers are encouraged to include the capsule for quick validation.
+    return True, []
+
+
+def sample_size(total: int, sample: Union[int, float]) -> int:
+    """Resolve a sample spec (count, or fraction in (0, 1]) to a number of entries."""
+    if isinstance(sample, bool):
+        raise TypeError("sample must be an int count or a float fraction")
+    if isinstance(sample, int):
+        if sample < 1:
+            raise ValueError("sample count must be >= 1")
+        return min(sample, total)
+    if not (0.0 < sample <= 1.0):
+        raise ValueError("sample fraction must be in (0, 1]")
+    # Exact decimal arithmetic: 0.07 * 100 is 7.000000000000001 in floats.
+    return min(total, math.ceil(Fraction(str(sample)) * total))
+
+
+def wilson_interval(errors: int, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion errors/n."""
+    if n == 0:
+        return (0.0, 1.0)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = errors / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    lo = 0.0 if errors == 0 else max(0.0, center - half)
+    hi = 1.0 if errors == n else min(1.0, center + half)
+    return (lo, hi)
+
+
+def verify_registry(
+    registry: Registry,
+    *,
+    strict: bool = True,
+    sample: Optional[Union[int, float]] = None,
+    seed: int = 0,
+    max_errors: Optional[int] = None,
+    confidence: float = 0.95,
+) -> VerificationResult:
+    """Verify a KRC-0 registry.
+
+    - `sample`: check only a seeded, uniform random subset of entries (an int count
+      or a float fraction). The result reports an estimated error rate with a
+      Wilson confidence interval at `confidence`.
+    - `max_errors`: stop once this many error-level issues are found (1 = fail fast).
+    """
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("max_errors must be >= 1")
+    if not (0.0 < confidence < 1.0):
+        raise ValueError("confidence must be in (0, 1)")
+
+    urls = registry.urls
+    total = len(urls)
+
+    indices: Iterable[int]
+    sampled = False
+    if sample is not None:
+        k = sample_size(total, sample)
+        if k < total:
+            # Uniform without replacement; checked in index order so issues stay sorted.
+            indices = sorted(random.Random(seed).sample(range(total), k))
+            sampled = True
+        else:
+            indices = range(total)
+    else:
+        indices = range(total)
+
+    issues: List[VerificationIssue] = []
+    decoded = 0
+    checked = 0
+    errors = 0
+    failed_entries = 0
+    stopped_early = False
+
+    for i in indices:
+        if max_errors is not None and errors >= max_errors:
+            stopped_early = True
+            break
+        ok_decode, entry_issues = _verify_entry(i, urls[i], strict)
+        checked += 1
+        if ok_decode:
+            decoded += 1
+        issues.extend(entry_issues)
+        entry_errors = sum(1 for issue in entry_issues if issue.level == "error")
+        if entry_errors:
+            errors += entry_errors
+            failed_entries += 1
 
-        # If pulse is present but beat/step is missing, that's allowed; verifier can't check.
-        # Producers are encouraged to include the capsule for quick validation.
+    error_rate: Optional[float] = None
+    error_rate_ci: Optional[Tuple[float, float]] = None
+    if not stopped_early and checked:
+        error_rate = failed_entries / checked
+        if sampled:
+            error_rate_ci = wilson_interval(failed_entries, checked, confidence)
+        else:
+            error_rate_ci = (error_rate, error_rate)
 
-    ok = all(issue.level != "error" for issue in issues)
-    return VerificationResult(ok=ok, total=len(registry.urls), decoded=decoded, issues=issues)
+    ok = errors == 0
+    return VerificationResult(
+        ok=ok,
+        total=total,
+        decoded=decoded,
+        issues=issues,
+        checked=checked,
+        sampled=sampled,
+        stopped_early=stopped_early,
+        error_rate=error_rate,
+        error_rate_ci=error_rate_ci,
+        confidence=confidence if sampled else None,
+    )
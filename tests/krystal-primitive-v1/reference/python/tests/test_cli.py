@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from krystal.cli import main
+
+
+def _write_registry(tmp_path: Path, n_good: int, n_bad: int) -> Path:
+    fixtures = Path(__file__).parent / "fixtures" / "registry_sample.json"
+    good = json.loads(fixtures.read_text(encoding="utf-8"))["urls"]
+    urls = [good[i % len(good)] for i in range(n_good)]
+    urls += [f"https://phi.network/unknown/{i}" for i in range(n_bad)]
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"urls": urls}), encoding="utf-8")
+    return path
+
+
+def _run(argv: list[str], capsys) -> tuple[int, dict]:
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    return exc.value.code, json.loads(capsys.readouterr().out)
+
+
+def _usage_error(argv: list[str], capsys) -> str:
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+    return capsys.readouterr().err
+
+
+def test_cli_verify_full_pass(tmp_path, capsys):
+    path = _write_registry(tmp_path, 5, 0)
+    rc, out = _run(["verify-registry", str(path)], capsys)
+    assert rc == 0
+    assert out["ok"] and not out["partial"]
+    assert out["checked"] == out["total"] == 5
+    assert out["errorRate"] == 0.0 and out["errorRateCI"] == [0.0, 0.0]
+    assert out["confidence"] is None
+
+
+def test_cli_verify_sample(tmp_path, capsys):
+    path = _write_registry(tmp_path, 20, 20)
+    rc, out = _run(["verify-registry", str(path), "--sample", "10", "--seed", "4", "--confidence", "0.9"], capsys)
+    assert out["partial"] and out["sampled"] and not out["stoppedEarly"]
+    assert out["checked"] == 10 and out["total"] == 40
+    assert out["confidence"] == 0.9
+    lo, hi = out["errorRateCI"]
+    assert lo <= out["errorRate"] <= hi
+    assert rc == (0 if out["ok"] else 1)
+
+    rc, out = _run(["verify-registry", str(path), "--sample", "0.25"], capsys)
+    assert out["checked"] == 10
+
+
+def test_cli_verify_fail_fast_and_max_errors(tmp_path, capsys):
+    path = _write_registry(tmp_path, 2, 6)
+    rc, out = _run(["verify-registry", str(path), "--fail-fast"], capsys)
+    assert rc == 1
+    assert out["partial"] and out["stoppedEarly"] and not out["sampled"]
+    assert out["checked"] == 3 and len(out["issues"]) == 1
+    assert out["errorRate"] is None and out["errorRateCI"] is None
+
+    rc, out = _run(["verify-registry", str(path), "--max-errors", "3"], capsys)
+    assert rc == 1
+    assert out["checked"] == 5 and len(out["issues"]) == 3
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        ["--sample", "0"],
+        ["--sample", "1.0"],
+        ["--sample", "1e3"],
+        ["--sample", "abc"],
+        ["--max-errors", "0"],
+        ["--confidence", "95"],
+        ["--confidence", "0"],
+        ["--fail-fast", "--max-errors", "5"],
+    ],
+)
+def test_cli_verify_rejects_invalid_options(tmp_path, capsys, extra):
+    path = _write_registry(tmp_path, 2, 0)
+    err = _usage_error(["verify-registry", str(path), *extra], capsys)
+    assert "usage:" in err
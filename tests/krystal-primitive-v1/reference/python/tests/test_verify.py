@@ -3,8 +3,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from krystal.registry import load_registry
-from krystal.verify import verify_registry
+import pytest
+
+from krystal.b64 import b64url_encode_unpadded
+from krystal.registry import Registry, load_registry
+from krystal.verify import sample_size, verify_registry, wilson_interval
 
 
 def test_verify_registry_sample_ok():
@@ -12,3 +15,125 @@ def test_verify_registry_sample_ok():
     reg = load_registry(fixtures)
     result = verify_registry(reg, strict=True)
     assert result.ok, result.issues
+
+
+def _mixed_registry(n_good: int, n_bad: int):
+    fixtures = Path(__file__).parent / "fixtures" / "registry_sample.json"
+    good = load_registry(fixtures).urls
+    urls = [good[i % len(good)] for i in range(n_good)]
+    urls += [f"https://phi.network/unknown/{i}" for i in range(n_bad)]
+    return Registry(urls=urls)
+
+
+def test_verify_registry_full_pass_not_partial():
+    reg = _mixed_registry(6, 2)
+    result = verify_registry(reg, strict=True)
+    assert not result.ok
+    assert not result.partial
+    assert result.checked == result.total == 8
+    assert result.error_rate == 0.25
+    assert result.error_rate_ci == (0.25, 0.25)
+
+
+def test_verify_registry_sample_is_seeded_and_reproducible():
+    reg = _mixed_registry(90, 10)
+    a = verify_registry(reg, sample=20, seed=7)
+    b = verify_registry(reg, sample=20, seed=7)
+    assert a == b
+    assert a.sampled and a.partial and not a.stopped_early
+    assert a.checked == 20 and a.total == 100
+    lo, hi = a.error_rate_ci
+    assert 0.0 <= lo <= a.error_rate <= hi <= 1.0
+    idx = [i.index for i in a.issues]
+    assert idx == sorted(idx)
+
+    frac = verify_registry(reg, sample=0.1, seed=7)
+    assert frac.checked == 10
+
+    whole = verify_registry(reg, sample=1.0)
+    assert not whole.sampled and whole.checked == 100
+
+
+def test_verify_registry_fail_fast_and_max_errors():
+    reg = _mixed_registry(3, 5)
+    ff = verify_registry(reg, max_errors=1)
+    assert not ff.ok
+    assert ff.stopped_early and ff.partial
+    assert ff.checked == 4
+    assert len(ff.issues) == 1
+    assert ff.error_rate is None
+
+    capped = verify_registry(reg, max_errors=3)
+    assert capped.checked == 6 and len(capped.issues) == 3
+
+    # Reaching K on the last entry is a complete pass, not an early stop.
+    exact = verify_registry(reg, max_errors=5)
+    assert not exact.stopped_early and exact.checked == 8
+
+    # Non-strict warnings never trigger an early stop.
+    lenient = verify_registry(reg, strict=False, max_errors=1)
+    assert lenient.ok and not lenient.partial
+
+
+def _kks_mismatch_url(pulse: int) -> str:
+    capsule = json.dumps({"u": pulse, "b": 0, "s": 0}).encode("utf-8")
+    return f"https://phi.network/s/{'0' * 64}?p=c:{b64url_encode_unpadded(capsule)}"
+
+
+def test_sample_size_rejects_zero_and_bad_fractions():
+    assert sample_size(100, 1) == 1
+    assert sample_size(100, 0.05) == 5
+    assert sample_size(100, 0.07) == 7
+    assert [sample_size(100, f) for f in (0.14, 0.28, 0.55, 0.56)] == [14, 28, 55, 56]
+    assert sample_size(100, 0.071) == 8
+    assert sample_size(3, 10) == 3
+    with pytest.raises(ValueError):
+        sample_size(100, 0)
+    with pytest.raises(ValueError):
+        sample_size(100, 0.0)
+    with pytest.raises(ValueError):
+        sample_size(100, 1.5)
+    with pytest.raises(ValueError):
+        verify_registry(_mixed_registry(3, 0), sample=0)
+
+
+def test_wilson_interval_values():
+    lo, hi = wilson_interval(0, 1, 0.95)
+    assert lo == 0.0
+    assert hi == pytest.approx(0.7935, abs=1e-4)
+
+    lo, hi = wilson_interval(5, 5, 0.95)
+    assert hi == 1.0
+    assert lo == pytest.approx(0.5655, abs=1e-4)
+
+    lo, hi = wilson_interval(10, 100, 0.95)
+    assert lo == pytest.approx(0.0552, abs=1e-4)
+    assert hi == pytest.approx(0.1744, abs=1e-4)
+
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_verify_registry_different_seeds_pick_different_subsets():
+    reg = _mixed_registry(0, 100)
+    a = {i.index for i in verify_registry(reg, sample=10, seed=1).issues}
+    b = {i.index for i in verify_registry(reg, sample=10, seed=2).issues}
+    assert len(a) == len(b) == 10
+    assert a != b
+
+
+def test_verify_registry_sample_with_max_errors():
+    reg = _mixed_registry(0, 100)
+    result = verify_registry(reg, sample=20, seed=3, max_errors=2)
+    assert result.sampled and result.stopped_early and result.partial
+    assert result.checked == 2
+    assert result.error_rate is None and result.error_rate_ci is None
+    assert not result.ok
+
+
+def test_verify_registry_kks_mismatch_stops_early_when_non_strict():
+    good = _mixed_registry(2, 0).urls
+    reg = Registry(urls=[good[0], _kks_mismatch_url(9833095), good[1], _kks_mismatch_url(9833095)])
+    result = verify_registry(reg, strict=False, max_errors=1)
+    assert result.stopped_early and not result.ok
+    assert result.checked == 2
+    assert [(i.index, i.code, i.level) for i in result.issues] == [(1, "kks_mismatch", "error")]